@@ -5,6 +5,7 @@ from dotenv import dotenv_values, set_key
 from dotenv_vault import load_dotenv
 
 from emu import app, utils
+from emu.pool import MinerPool
 
 cli = typer.Typer()
 
@@ -41,21 +42,30 @@ def deploy():
 
 
 @cli.command()
-def mine():
+def mine(
+    workers: int = typer.Option(1, help="Number of worker processes to search with."),
+    backend: str = typer.Option("hashlib", help=f"Nonce search backend: {', '.join(utils.BACKENDS)}."),
+):
     """Mine a new block."""
     algod_client, indexer_client, account = utils.get_clients(emu_env)
     app_client = app.get_app_client(account, emu_env, algod_client, indexer_client)
 
-    async def main():
+    async def main(pool: MinerPool | None):
         await app.producer(
             app_client=app_client,
             algod_client=algod_client,
             asset_id=emu_env["ASSET_ID"],
             coinbase=account.address.encode("utf-8"),
             state=None,
+            pool=pool,
+            backend=backend,
         )
 
-    asyncio.run(main())
+    if workers > 1:
+        with MinerPool(workers, backend) as pool:
+            asyncio.run(main(pool))
+    else:
+        asyncio.run(main(None))
 
 
 @cli.command()
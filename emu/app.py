@@ -1,4 +1,5 @@
 import asyncio
+from collections.abc import Callable
 
 import algokit_utils
 from algokit_utils import (
@@ -14,6 +15,7 @@ from rich.table import Column, Table
 
 from emu import utils
 from emu.models import EmuState
+from emu.pool import MinerPool
 from smart_contracts.artifacts.emulator.client import EmulatorClient
 
 
@@ -131,6 +133,26 @@ def read_latest_block(app_client: EmulatorClient) -> EmuState | None:
     return state
 
 
+def hashrate_reporter(interval: float = 10.0) -> Callable[[int, float], None]:
+    """Returns a `find_nonce` progress callback that prints the hash rate.
+
+    Args:
+        interval (float, optional): Minimum seconds between reports. Defaults to 10.0.
+
+    Returns:
+        Callable[[int, float], None]: The progress callback.
+    """
+    last_report = 0.0
+
+    def report(hashes: int, seconds: float) -> None:
+        nonlocal last_report
+        if seconds - last_report >= interval:
+            last_report = seconds
+            pprint(f"Hash rate: {utils.hashrate(hashes, seconds):,.0f} H/s ({hashes:,} hashes)")
+
+    return report
+
+
 def mine(
     algod_client: AlgodClient,
     app_client: EmulatorClient,
@@ -161,6 +183,8 @@ async def consumer(
     asset_id: int,
     coinbase: bytes,
     state: EmuState,
+    pool: MinerPool | None = None,
+    backend: str = "hashlib",
 ) -> None:
     """Consumes the state and mines the next block.
 
@@ -170,9 +194,14 @@ async def consumer(
         asset_id (int): EMU asset ID.
         coinbase (bytes): The coinbase.
         state (EmuState): The emulator state.
+        pool (MinerPool | None, optional): Worker pool to search with. Defaults to None (single process).
+        backend (str, optional): The search backend when not using a pool. Defaults to "hashlib".
     """
 
-    nonce = utils.find_nonce(state, coinbase)
+    if pool:
+        nonce = pool.find_nonce(state, coinbase, on_progress=hashrate_reporter())
+    else:
+        nonce = utils.find_nonce(state, coinbase, on_progress=hashrate_reporter(), backend=backend)
     if isinstance(nonce, int):
         reward = mine(algod_client, app_client, asset_id, nonce, coinbase)
         pprint(f"Block mined! Reward: {reward}")
@@ -184,6 +213,8 @@ async def producer(
     asset_id: int,
     coinbase: bytes,
     state: EmuState | None = None,
+    pool: MinerPool | None = None,
+    backend: str = "hashlib",
 ) -> None:
     """Async task producer.
 
@@ -197,6 +228,8 @@ async def producer(
         asset_id (int): EMU asset ID.
         coinbase (bytes): The coinbase.
         state (EmuState | None, optional): The emulator state. Defaults to None.
+        pool (MinerPool | None, optional): Worker pool to search with. Defaults to None (single process).
+        backend (str, optional): The search backend when not using a pool. Defaults to "hashlib".
     """
     prev_state: EmuState | None = None
     task = None
@@ -207,7 +240,7 @@ async def producer(
                 task.cancel()
             pprint("New block found!")
             print_state(state)
-            task = asyncio.create_task(consumer(app_client, algod_client, asset_id, coinbase, state))
+            task = asyncio.create_task(consumer(app_client, algod_client, asset_id, coinbase, state, pool, backend))
             try:
                 await asyncio.wait_for(task, timeout=10)
             except asyncio.TimeoutError:
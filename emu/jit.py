@@ -0,0 +1,119 @@
+"""Numba-compiled parallel double SHA-256 nonce search.
+
+Every nonce in a batch is hashed and compared against the target by compiled code,
+spread across all cores with `prange`. Compiled functions are cached on disk, so the
+JIT cost is only paid the first time the miner runs.
+
+This backend requires Numba, which is an optional dependency.
+"""
+
+import numpy as np
+from numba import njit, prange, set_num_threads
+
+from emu.vectorized import INITIAL_HASH, ROUND_CONSTANTS, message_blocks
+
+# Number of nonces hashed per compiled call.
+LANES = 2**16
+
+__all__ = ["LANES", "scan_nonces", "set_num_threads"]
+
+_MASK = 0xFFFFFFFF
+# Words are held in int64 so that sums and shifts never overflow or get promoted to floats.
+_K = ROUND_CONSTANTS.astype(np.int64)
+_H0 = INITIAL_HASH.astype(np.int64)
+
+
+@njit(cache=True, inline="always")
+def _rotr(x: int, n: int) -> int:
+    return ((x >> n) | (x << (32 - n))) & _MASK
+
+
+@njit(cache=True)
+def _compress(state: np.ndarray, w: np.ndarray) -> None:
+    """Applies the SHA-256 compression function in place.
+
+    Args:
+        state (np.ndarray): The eight chaining words, updated in place.
+        w (np.ndarray): A 64-word schedule buffer with the message block in the first sixteen words.
+    """
+    for i in range(16, 64):
+        s0 = _rotr(w[i - 15], 7) ^ _rotr(w[i - 15], 18) ^ (w[i - 15] >> 3)
+        s1 = _rotr(w[i - 2], 17) ^ _rotr(w[i - 2], 19) ^ (w[i - 2] >> 10)
+        w[i] = (w[i - 16] + s0 + w[i - 7] + s1) & _MASK
+    a, b, c, d, e, f, g, h = state[0], state[1], state[2], state[3], state[4], state[5], state[6], state[7]
+    for i in range(64):
+        t1 = (h + (_rotr(e, 6) ^ _rotr(e, 11) ^ _rotr(e, 25)) + ((e & f) ^ (~e & g)) + _K[i] + w[i]) & _MASK
+        t2 = ((_rotr(a, 2) ^ _rotr(a, 13) ^ _rotr(a, 22)) + ((a & b) ^ (a & c) ^ (b & c))) & _MASK
+        h, g, f, e, d, c, b, a = g, f, e, (d + t1) & _MASK, c, b, a, (t1 + t2) & _MASK
+    state[0] = (state[0] + a) & _MASK
+    state[1] = (state[1] + b) & _MASK
+    state[2] = (state[2] + c) & _MASK
+    state[3] = (state[3] + d) & _MASK
+    state[4] = (state[4] + e) & _MASK
+    state[5] = (state[5] + f) & _MASK
+    state[6] = (state[6] + g) & _MASK
+    state[7] = (state[7] + h) & _MASK
+
+
+@njit(cache=True, parallel=True)
+def _search(blocks: np.ndarray, target: np.ndarray, high: int, low: int, count: int) -> int:
+    """Hashes `count` consecutive nonces in parallel and returns the offset of the first solution.
+
+    Args:
+        blocks (np.ndarray): The (n, 16) message blocks, with a zero nonce.
+        target (np.ndarray): The eight big-endian target words.
+        high (int): The high word of the first nonce.
+        low (int): The low word of the first nonce.
+        count (int): The number of nonces to hash.
+
+    Returns:
+        int: The offset of the first nonce that solves the block, else -1.
+    """
+    hits = np.zeros(count, dtype=np.bool_)
+    for lane in prange(count):
+        w = np.empty(64, dtype=np.int64)
+        state = _H0.copy()
+        nonce_low = low + lane
+        for i in range(blocks.shape[0]):
+            w[:16] = blocks[i]
+            if i == 0:
+                w[8] = (high + (nonce_low >> 32)) & _MASK
+                w[9] = nonce_low & _MASK
+            _compress(state, w)
+        w[:8] = state
+        w[8] = 0x80000000
+        w[9:15] = 0
+        w[15] = 256
+        digest = _H0.copy()
+        _compress(digest, w)
+        for i in range(8):
+            if digest[i] != target[i]:
+                hits[lane] = digest[i] < target[i]
+                break
+    for lane in range(count):
+        if hits[lane]:
+            return lane
+    return -1
+
+
+def scan_nonces(block_hash: bytes, target: bytes, coinbase: bytes, start: int, stop: int) -> int | None:
+    """Searches the nonces in [start, stop) for one that solves the block, LANES nonces at a time.
+
+    Args:
+        block_hash (bytes): The current block hash.
+        target (bytes): The 32-byte target (see `utils.pad_target`).
+        coinbase (bytes): The coinbase.
+        start (int): The first nonce to try.
+        stop (int): The nonce to stop before.
+
+    Returns:
+        int | None: The first nonce in the range that solves the block, else None.
+    """
+    blocks = np.array(message_blocks(block_hash, coinbase), dtype=np.int64)
+    target_words = np.frombuffer(target, dtype=">u4").astype(np.int64)
+    for batch_start in range(start, stop, LANES):
+        count = min(LANES, stop - batch_start)
+        offset = _search(blocks, target_words, batch_start >> 32, batch_start & _MASK, count)
+        if offset >= 0:
+            return batch_start + offset
+    return None
@@ -0,0 +1,272 @@
+"""Multi-process nonce search with a persistent worker pool."""
+
+import multiprocessing as mp
+import os
+import queue
+import struct
+import time
+import warnings
+from collections.abc import Callable
+from multiprocessing.shared_memory import SharedMemory
+from multiprocessing.synchronize import Condition
+
+from emu import utils
+from emu.models import EmuState
+
+# The coinbase is an ABI byte[] app arg, so it can never exceed the 2KB app args limit.
+MAX_COINBASE = 2048
+# job, stop_job, start, last nonce, block_hash, target, coinbase length
+# (the last nonce is stored rather than the exclusive stop, which may be 2**64)
+_HEADER = struct.Struct(">QQQQ32s32sH")
+_JOBS = struct.Struct(">QQ")
+# Job number that tells the workers to exit.
+_SHUTDOWN = 2**64 - 1
+_COINBASE_OFFSET = _HEADER.size
+_COUNTERS_OFFSET = _COINBASE_OFFSET + MAX_COINBASE
+_COUNTER = struct.Struct(">Q")
+
+
+def split_range(start: int, stop: int, parts: int) -> list[tuple[int, int]]:
+    """Splits [start, stop) into contiguous, non-overlapping ranges.
+
+    Args:
+        start (int): The start of the range.
+        stop (int): The end of the range (exclusive).
+        parts (int): The number of ranges.
+
+    Returns:
+        list[tuple[int, int]]: The (start, stop) of each range.
+    """
+    span, remainder = divmod(stop - start, parts)
+    bounds = [start + i * span + min(i, remainder) for i in range(parts + 1)]
+    return list(zip(bounds, bounds[1:], strict=False))
+
+
+def _work(
+    shm_name: str,
+    index: int,
+    workers: int,
+    backend: str,
+    condition: Condition,
+    results: mp.Queue,
+) -> None:
+    """Worker process main loop.
+
+    Waits for a new job to be published in shared memory, searches its share of the
+    nonce range in batches, and stops early once the job is superseded or stopped.
+
+    Args:
+        shm_name (str): Name of the shared memory block.
+        index (int): The worker index.
+        workers (int): The total number of workers.
+        backend (str): The search backend (see `utils.get_kernel`).
+        condition (Condition): Notified when a new job is published.
+        results (mp.Queue): Queue of (job, worker index, nonce or None) results.
+    """
+    # One thread per worker: the pool already runs a process per core, so a numba kernel
+    # spreading each batch across every core would oversubscribe them. The parent has
+    # already warned about any backend fallback.
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        kernel = utils.get_kernel(backend, threads=1)
+    shm = SharedMemory(name=shm_name)
+    buf = shm.buf
+    seen = 0
+    try:
+        while True:
+            with condition:
+                condition.wait_for(lambda seen=seen: _JOBS.unpack_from(buf)[0] != seen)
+                job, _, start, last, block_hash, target, length = _HEADER.unpack_from(buf)
+                coinbase = bytes(buf[_COINBASE_OFFSET : _COINBASE_OFFSET + length])
+            seen = job
+            if job == _SHUTDOWN:
+                return
+            start, stop = split_range(start, last + 1, workers)[index]
+            counter = _COUNTERS_OFFSET + index * _COUNTER.size
+            _COUNTER.pack_into(buf, counter, 0)
+            nonce = None
+            for batch_start in range(start, stop, utils.BATCH_SIZE):
+                current, stopped = _JOBS.unpack_from(buf)
+                if current != job or stopped == job:
+                    break
+                batch_stop = min(batch_start + utils.BATCH_SIZE, stop)
+                nonce = kernel(block_hash, target, coinbase, batch_start, batch_stop)
+                tried = (batch_stop if nonce is None else nonce + 1) - start
+                _COUNTER.pack_into(buf, counter, tried)
+                if nonce is not None:
+                    break
+            results.put((job, index, nonce))
+    finally:
+        shm.close()
+
+
+class MinerPool:
+    """A pool of worker processes that search disjoint nonce ranges in parallel.
+
+    The workers are started once and stay alive between blocks. Each new search is
+    published to them through shared memory, and the first worker to find a solution
+    stops the others.
+    """
+
+    def __init__(self, workers: int | None = None, backend: str = "hashlib"):
+        """Starts the worker processes.
+
+        Args:
+            workers (int | None, optional): Number of worker processes. Defaults to the CPU count.
+            backend (str, optional): The search backend each worker uses. Defaults to "hashlib".
+
+        Raises:
+            ValueError: If the backend name is invalid.
+        """
+        utils.get_kernel(backend)
+        self.workers = workers or os.cpu_count() or 1
+        self.backend = backend
+        self._shm = SharedMemory(create=True, size=_COUNTERS_OFFSET + self.workers * _COUNTER.size)
+        self._shm.buf[: _HEADER.size] = bytes(_HEADER.size)
+        self._condition = mp.Condition()
+        self._results: mp.Queue = mp.Queue()
+        self._job = 0
+        self._processes = [
+            mp.Process(
+                target=_work,
+                args=(self._shm.name, index, self.workers, backend, self._condition, self._results),
+                daemon=True,
+            )
+            for index in range(self.workers)
+        ]
+        for process in self._processes:
+            process.start()
+
+    def __enter__(self) -> "MinerPool":
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+    def hashes(self) -> list[int]:
+        """Returns the number of nonces each worker has tried for the current job.
+
+        Returns:
+            list[int]: Nonces tried, indexed by worker.
+        """
+        buf = self._shm.buf
+        return [_COUNTER.unpack_from(buf, _COUNTERS_OFFSET + index * _COUNTER.size)[0] for index in range(self.workers)]
+
+    def _publish(self, state: EmuState, coinbase: bytes, start: int, stop: int) -> int:
+        """Publishes a new job to the workers.
+
+        Args:
+            state (EmuState): The emulator state.
+            coinbase (bytes): The coinbase.
+            start (int): The first nonce to try.
+            stop (int): The nonce to stop before.
+
+        Raises:
+            ValueError: If the coinbase is longer than MAX_COINBASE.
+
+        Returns:
+            int: The job number.
+        """
+        if len(coinbase) > MAX_COINBASE:
+            raise ValueError(f"Coinbase must be at most {MAX_COINBASE} bytes")
+        with self._condition:
+            self._job += 1
+            buf = self._shm.buf
+            buf[_COINBASE_OFFSET : _COINBASE_OFFSET + len(coinbase)] = coinbase
+            _HEADER.pack_into(
+                buf,
+                0,
+                self._job,
+                0,
+                start,
+                stop - 1,
+                state.block_hash,
+                utils.pad_target(state.target),
+                len(coinbase),
+            )
+            buf[_COUNTERS_OFFSET : _COUNTERS_OFFSET + self.workers * _COUNTER.size] = bytes(
+                self.workers * _COUNTER.size
+            )
+            self._condition.notify_all()
+        return self._job
+
+    def _check_workers(self) -> None:
+        """Checks that every worker process is still running.
+
+        Raises:
+            RuntimeError: If a worker process has died.
+        """
+        for process in self._processes:
+            if not process.is_alive():
+                self.stop()
+                raise RuntimeError(f"Worker process exited with code {process.exitcode}")
+
+    def stop(self) -> None:
+        """Stops the workers searching the current job."""
+        _JOBS.pack_into(self._shm.buf, 0, self._job, self._job)
+
+    def find_nonce(
+        self,
+        state: EmuState,
+        coinbase: bytes,
+        start: int = 0,
+        stop: int = utils.NONCE_SPACE,
+        on_progress: Callable[[int, float], None] | None = None,
+        interval: float = 1.0,
+    ) -> int | None:
+        """Finds a nonce for the block using every worker.
+
+        Args:
+            state (EmuState): The emulator state.
+            coinbase (bytes): The coinbase.
+            start (int, optional): The first nonce to try. Defaults to 0.
+            stop (int, optional): The nonce to stop before. Defaults to NONCE_SPACE.
+            on_progress (Callable[[int, float], None] | None, optional): Called every `interval` seconds
+                with the total number of nonces tried and the seconds elapsed. Defaults to None.
+            interval (float, optional): Seconds between progress reports. Defaults to 1.0.
+
+        Raises:
+            RuntimeError: If a worker process has died.
+
+        Returns:
+            int | None: The first nonce found by any worker, else None.
+        """
+        if start >= stop:
+            return None
+        self._check_workers()
+        started = time.perf_counter()
+        job = self._publish(state, coinbase, start, stop)
+        pending = self.workers
+        nonce = None
+        while pending and nonce is None:
+            try:
+                result_job, _, nonce = self._results.get(timeout=interval)
+            except queue.Empty:
+                self._check_workers()
+            else:
+                if result_job != job:
+                    nonce = None
+                    continue
+                pending -= 1
+            if on_progress is not None:
+                on_progress(sum(self.hashes()), time.perf_counter() - started)
+        self.stop()
+        return nonce
+
+    def close(self) -> None:
+        """Stops and joins the worker processes, and releases the shared memory."""
+        self.stop()
+        if all(process.is_alive() for process in self._processes):
+            with self._condition:
+                _JOBS.pack_into(self._shm.buf, 0, _SHUTDOWN, _SHUTDOWN)
+                self._condition.notify_all()
+        else:
+            # notify_all() waits for every sleeper to wake, which a dead worker never will.
+            for process in self._processes:
+                process.terminate()
+        for process in self._processes:
+            process.join(timeout=5)
+            if process.is_alive():
+                process.terminate()
+        self._shm.close()
+        self._shm.unlink()
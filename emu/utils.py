@@ -1,5 +1,9 @@
 """Utility functions for emu."""
 
+import struct
+import time
+import warnings
+from collections.abc import Callable
 from datetime import datetime
 from hashlib import sha256
 
@@ -22,6 +26,18 @@ from algosdk.v2client.algod import AlgodClient
 from emu.models import EmuState
 from smart_contracts.artifacts.emulator.client import EmulatorClient
 
+# The nonce is an ARC-4 uint64, so the full search space is [0, 2**64).
+NONCE_SPACE = 2**64
+# Number of nonces hashed between progress reports.
+BATCH_SIZE = 2**16
+
+_pack_nonce = struct.Struct(">Q").pack_into
+
+# A nonce search kernel: (block_hash, 32-byte target, coinbase, start, stop) -> nonce or None.
+Kernel = Callable[[bytes, bytes, bytes, int, int], int | None]
+# The numpy backend is experimental and slower than hashlib (see `emu.vectorized`).
+BACKENDS = ("hashlib", "numpy", "numba")
+
 
 def get_suggested_params(algod_client: AlgodClient) -> SuggestedParams:
     """Gets suggested parameters for a transaction.
@@ -115,20 +131,133 @@ def itob(n: int) -> bytes:
     return n.to_bytes(length=8, byteorder="big")
 
 
-def find_nonce(state: EmuState, coinbase: bytes) -> int | None:
+def pad_target(target: bytes) -> bytes:
+    """Left-pads the target to 32 bytes.
+
+    A 32-byte big-endian digest compares lexicographically exactly as its integer value does,
+    so a padded target can be compared against digests without converting either to an int.
+
+    Args:
+        target (bytes): The target, as stored in global state.
+
+    Returns:
+        bytes: The 32-byte target.
+    """
+    return btoi(target).to_bytes(length=32, byteorder="big")
+
+
+def scan_nonces(block_hash: bytes, target: bytes, coinbase: bytes, start: int, stop: int) -> int | None:
+    """Searches the nonces in [start, stop) for one that solves the block.
+
+    The hash of the block hash prefix is computed once and copied for every nonce,
+    and the nonce is written into a reused buffer rather than concatenated.
+
+    Args:
+        block_hash (bytes): The current block hash.
+        target (bytes): The 32-byte target (see `pad_target`).
+        coinbase (bytes): The coinbase.
+        start (int): The first nonce to try.
+        stop (int): The nonce to stop before.
+
+    Returns:
+        int | None: The first nonce in the range that solves the block, else None.
+    """
+    copy = sha256(block_hash).copy
+    buffer = bytearray(8 + len(coinbase))
+    buffer[8:] = coinbase
+    lead = target[0]
+    for nonce in range(start, stop):
+        _pack_nonce(buffer, 0, nonce)
+        inner = copy()
+        inner.update(buffer)
+        attempt = sha256(inner.digest()).digest()
+        if attempt[0] <= lead and attempt < target:
+            return nonce
+    return None
+
+
+def get_kernel(backend: str, threads: int | None = None) -> Kernel:
+    """Returns the nonce search kernel for a backend.
+
+    Backends with optional dependencies are imported on first use.
+    The numba backend falls back to hashlib, with a warning, when Numba is not installed.
+
+    Args:
+        backend (str): One of BACKENDS.
+        threads (int | None, optional): Number of threads the numba backend may use.
+            Defaults to None (every core).
+
+    Raises:
+        ValueError: If the backend name is invalid.
+
+    Returns:
+        Kernel: The nonce search kernel.
+    """
+    if backend == "hashlib":
+        return scan_nonces
+    if backend == "numpy":
+        from emu import vectorized
+
+        return vectorized.scan_nonces
+    if backend == "numba":
+        try:
+            from emu import jit
+        except ImportError:
+            warnings.warn("Numba is not installed, falling back to the hashlib backend", RuntimeWarning, stacklevel=2)
+            return scan_nonces
+        if threads is not None:
+            jit.set_num_threads(threads)
+        return jit.scan_nonces
+    raise ValueError(f"Invalid backend: {backend}")
+
+
+def find_nonce(
+    state: EmuState,
+    coinbase: bytes,
+    start: int = 0,
+    stop: int = NONCE_SPACE,
+    on_progress: Callable[[int, float], None] | None = None,
+    backend: str = "hashlib",
+) -> int | None:
     """Finds a nonce for the block.
 
     Args:
         state (EmuState): The emulator state.
         coinbase (bytes): The coinbase.
+        start (int, optional): The first nonce to try. Defaults to 0.
+        stop (int, optional): The nonce to stop before. Defaults to NONCE_SPACE.
+        on_progress (Callable[[int, float], None] | None, optional): Called after every batch
+            with the number of nonces tried and the seconds elapsed. Defaults to None.
+        backend (str, optional): The search backend, one of BACKENDS. Defaults to "hashlib".
 
     Returns:
         int | None: The nonce if found, else None.
     """
-    for nonce in range(2**64):
-        attempt = sha256(sha256(state.block_hash + itob(nonce) + coinbase).digest()).digest()
-        if btoi(attempt) < btoi(state.target):
+    kernel = get_kernel(backend)
+    target = pad_target(state.target)
+    started = time.perf_counter()
+    for batch_start in range(start, stop, BATCH_SIZE):
+        batch_stop = min(batch_start + BATCH_SIZE, stop)
+        nonce = kernel(state.block_hash, target, coinbase, batch_start, batch_stop)
+        if on_progress is not None:
+            tried = (batch_stop if nonce is None else nonce + 1) - start
+            on_progress(tried, time.perf_counter() - started)
+        if nonce is not None:
             return nonce
+    return None
+
+
+def hashrate(hashes: int, seconds: float) -> float:
+    """Calculates the hash rate.
+
+    Args:
+        hashes (int): The number of hashes computed.
+        seconds (float): The time taken.
+
+    Returns:
+        float: Hashes per second.
+    """
+    return hashes / seconds if seconds > 0 else 0.0
 
 
 def fetch_state(app_client: EmulatorClient) -> EmuState:
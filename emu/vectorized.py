@@ -0,0 +1,151 @@
+"""Batched double SHA-256 nonce search in NumPy uint32 lanes.
+
+The mining message always has the same shape: a 32-byte block hash, an 8-byte big-endian
+nonce and a fixed coinbase. Only message words 8 and 9 change between nonces, so a whole
+batch of nonces can be hashed at once, with one NumPy array per 32-bit word.
+
+This backend is experimental: every SHA-256 step is a separate NumPy call over the whole
+batch, and on a single core it runs at roughly half to two thirds the speed of the hashlib
+kernel (about 370k vs 525k H/s with a 58-byte coinbase). Writing the ufuncs in place with
+`out=` does not close the gap. It serves as a reference for batched hashing; use the
+hashlib or numba backends for mining.
+
+This backend requires NumPy, which is an optional dependency.
+"""
+
+import numpy as np
+
+# Number of nonces hashed per NumPy call.
+LANES = 16384
+
+# fmt: off
+ROUND_CONSTANTS = np.array(
+    [
+        0x428A2F98, 0x71374491, 0xB5C0FBCF, 0xE9B5DBA5, 0x3956C25B, 0x59F111F1, 0x923F82A4, 0xAB1C5ED5,
+        0xD807AA98, 0x12835B01, 0x243185BE, 0x550C7DC3, 0x72BE5D74, 0x80DEB1FE, 0x9BDC06A7, 0xC19BF174,
+        0xE49B69C1, 0xEFBE4786, 0x0FC19DC6, 0x240CA1CC, 0x2DE92C6F, 0x4A7484AA, 0x5CB0A9DC, 0x76F988DA,
+        0x983E5152, 0xA831C66D, 0xB00327C8, 0xBF597FC7, 0xC6E00BF3, 0xD5A79147, 0x06CA6351, 0x14292967,
+        0x27B70A85, 0x2E1B2138, 0x4D2C6DFC, 0x53380D13, 0x650A7354, 0x766A0ABB, 0x81C2C92E, 0x92722C85,
+        0xA2BFE8A1, 0xA81A664B, 0xC24B8B70, 0xC76C51A3, 0xD192E819, 0xD6990624, 0xF40E3585, 0x106AA070,
+        0x19A4C116, 0x1E376C08, 0x2748774C, 0x34B0BCB5, 0x391C0CB3, 0x4ED8AA4A, 0x5B9CCA4F, 0x682E6FF3,
+        0x748F82EE, 0x78A5636F, 0x84C87814, 0x8CC70208, 0x90BEFFFA, 0xA4506CEB, 0xBEF9A3F7, 0xC67178F2,
+    ],
+    dtype=np.uint32,
+)
+# fmt: on
+INITIAL_HASH = np.array(
+    [0x6A09E667, 0xBB67AE85, 0x3C6EF372, 0xA54FF53A, 0x510E527F, 0x9B05688C, 0x1F83D9AB, 0x5BE0CD19],
+    dtype=np.uint32,
+)
+# Padding words of the second pass, which always hashes a single 32-byte digest.
+_DIGEST_PADDING = [np.uint32(0x80000000), *(np.uint32(0) for _ in range(6)), np.uint32(256)]
+# Index of the first nonce word in the message (the nonce follows the 32-byte block hash).
+_NONCE_WORD = 8
+
+
+def _rotr(x: np.ndarray, n: int) -> np.ndarray:
+    return (x >> np.uint32(n)) | (x << np.uint32(32 - n))
+
+
+def _compress(state: list[np.ndarray], block: list[np.ndarray]) -> list[np.ndarray]:
+    """Applies the SHA-256 compression function to every lane.
+
+    Args:
+        state (list[np.ndarray]): The eight chaining words.
+        block (list[np.ndarray]): The sixteen message words.
+
+    Returns:
+        list[np.ndarray]: The new chaining words.
+    """
+    w = list(block)
+    for i in range(16, 64):
+        s0 = _rotr(w[i - 15], 7) ^ _rotr(w[i - 15], 18) ^ (w[i - 15] >> np.uint32(3))
+        s1 = _rotr(w[i - 2], 17) ^ _rotr(w[i - 2], 19) ^ (w[i - 2] >> np.uint32(10))
+        w.append(w[i - 16] + s0 + w[i - 7] + s1)
+    a, b, c, d, e, f, g, h = state
+    for i in range(64):
+        t1 = h + (_rotr(e, 6) ^ _rotr(e, 11) ^ _rotr(e, 25)) + ((e & f) ^ (~e & g)) + ROUND_CONSTANTS[i] + w[i]
+        t2 = (_rotr(a, 2) ^ _rotr(a, 13) ^ _rotr(a, 22)) + ((a & b) ^ (a & c) ^ (b & c))
+        h, g, f, e, d, c, b, a = g, f, e, d + t1, c, b, a, t1 + t2
+    return [x + y for x, y in zip(state, (a, b, c, d, e, f, g, h), strict=True)]
+
+
+def message_blocks(block_hash: bytes, coinbase: bytes) -> list[list[np.uint32]]:
+    """Pads the mining message, with a zero nonce, and splits it into 16-word blocks.
+
+    Args:
+        block_hash (bytes): The current block hash.
+        coinbase (bytes): The coinbase.
+
+    Returns:
+        list[list[np.uint32]]: The message blocks.
+    """
+    message = block_hash + bytes(8) + coinbase
+    padding = b"\x80" + bytes((55 - len(message)) % 64) + (len(message) * 8).to_bytes(8, "big")
+    words = np.frombuffer(message + padding, dtype=">u4").astype(np.uint32)
+    return [list(words[i : i + 16]) for i in range(0, len(words), 16)]
+
+
+def sha256d(blocks: list[list[np.uint32]], nonces: np.ndarray) -> list[np.ndarray]:
+    """Double SHA-256 hashes the mining message for every nonce.
+
+    Args:
+        blocks (list[list[np.uint32]]): The message blocks (see `message_blocks`).
+        nonces (np.ndarray): The nonces, as uint64.
+
+    Returns:
+        list[np.ndarray]: The eight big-endian digest words, one array per word.
+    """
+    with np.errstate(over="ignore"):
+        first = list(blocks[0])
+        first[_NONCE_WORD] = (nonces >> np.uint64(32)).astype(np.uint32)
+        first[_NONCE_WORD + 1] = nonces.astype(np.uint32)
+        state = _compress(list(INITIAL_HASH), first)
+        for block in blocks[1:]:
+            state = _compress(state, block)
+        return _compress(list(INITIAL_HASH), state + _DIGEST_PADDING)
+
+
+def below_target(digest: list[np.ndarray], target: np.ndarray) -> np.ndarray:
+    """Compares every digest against the target.
+
+    Args:
+        digest (list[np.ndarray]): The eight big-endian digest words.
+        target (np.ndarray): The eight big-endian target words.
+
+    Returns:
+        np.ndarray: Boolean mask of the lanes whose digest is less than the target.
+    """
+    less = digest[0] < target[0]
+    equal = digest[0] == target[0]
+    for word, limit in zip(digest[1:], target[1:], strict=True):
+        if not equal.any():
+            break
+        less |= equal & (word < limit)
+        equal &= word == limit
+    return less
+
+
+def scan_nonces(block_hash: bytes, target: bytes, coinbase: bytes, start: int, stop: int) -> int | None:
+    """Searches the nonces in [start, stop) for one that solves the block, LANES nonces at a time.
+
+    Args:
+        block_hash (bytes): The current block hash.
+        target (bytes): The 32-byte target (see `utils.pad_target`).
+        coinbase (bytes): The coinbase.
+        start (int): The first nonce to try.
+        stop (int): The nonce to stop before.
+
+    Returns:
+        int | None: The first nonce in the range that solves the block, else None.
+    """
+    blocks = message_blocks(block_hash, coinbase)
+    target_words = np.frombuffer(target, dtype=">u4").astype(np.uint32)
+    lanes = np.arange(LANES, dtype=np.uint64)
+    for batch_start in range(start, stop, LANES):
+        count = min(LANES, stop - batch_start)
+        nonces = lanes[:count] + np.uint64(batch_start)
+        hits = below_target(sha256d(blocks, nonces), target_words)
+        if hits.any():
+            return batch_start + int(np.argmax(hits))
+    return None
@@ -0,0 +1,36 @@
+"""Test the Numba nonce search backend."""
+
+from datetime import datetime
+
+import pytest
+
+import emu.utils as utils
+from emu.models import EmuState
+
+jit = pytest.importorskip("emu.jit")
+
+BLOCK_HASH = b"\x00\x00\x00\x00\x00\x19\xd6h\x9c\x08Z\xe1e\x83\x1e\x93O\xf7c\xaeF\xa2\xa6\xc1r\xb3\xf1\xb6\n\x8c\xe2o"
+
+
+@pytest.mark.parametrize("coinbase", [b"", b"x" * 16, b"x" * 100])
+def test_scan_nonces_matches_hashlib(coinbase: bytes) -> None:
+    """Test the compiled kernel finds the same nonce as hashlib."""
+    target = utils.pad_target(b"\x0f" + b"\xff" * 30)
+    expected = utils.scan_nonces(BLOCK_HASH, target, coinbase, 0, 100_000)
+    assert jit.scan_nonces(BLOCK_HASH, target, coinbase, 0, 100_000) == expected
+    assert jit.scan_nonces(BLOCK_HASH, target, coinbase, 2**64 - 1000, 2**64) == utils.scan_nonces(
+        BLOCK_HASH, target, coinbase, 2**64 - 1000, 2**64
+    )
+
+
+def test_find_nonce_numba() -> None:
+    """Test find_nonce() with the Numba backend."""
+    state = EmuState(
+        block_height=0,
+        block_hash=BLOCK_HASH,
+        coinbase=b"",
+        prev_retarget_time=datetime(2021, 1, 1),
+        time=datetime(2021, 1, 1),
+        target=b"\x00?\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff",
+    )
+    assert utils.find_nonce(state, b"", backend="numba") == 64
@@ -0,0 +1,52 @@
+"""Test the multi-process nonce search."""
+
+from datetime import datetime
+
+import pytest
+
+from emu.models import EmuState
+from emu.pool import MinerPool, split_range
+
+STATE = EmuState(
+    block_height=0,
+    block_hash=b"\x00\x00\x00\x00\x00\x19\xd6h\x9c\x08Z\xe1e\x83\x1e\x93O\xf7c\xaeF\xa2\xa6\xc1r\xb3\xf1\xb6\n\x8c\xe2o",
+    coinbase=b"",
+    prev_retarget_time=datetime(2021, 1, 1),
+    time=datetime(2021, 1, 1),
+    target=b"\x00?\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff",
+)
+
+
+def test_split_range() -> None:
+    """Test split_range()."""
+    assert split_range(0, 10, 3) == [(0, 4), (4, 7), (7, 10)]
+    assert split_range(0, 2**64, 2) == [(0, 2**63), (2**63, 2**64)]
+
+
+def test_miner_pool_find_nonce() -> None:
+    """Test MinerPool.find_nonce() across jobs with the same workers."""
+    with MinerPool(workers=2) as pool:
+        assert pool.find_nonce(STATE, b"", stop=128) == 64
+        assert pool.find_nonce(STATE, b"", stop=64) is None
+        assert pool.find_nonce(STATE, b"", start=60, stop=200) == 64
+
+
+def test_miner_pool_invalid_backend() -> None:
+    """Test MinerPool() rejects an invalid backend before starting any workers."""
+    with pytest.raises(ValueError, match="Invalid backend"):
+        MinerPool(workers=2, backend="cuda")
+
+
+def test_miner_pool_dead_worker() -> None:
+    """Test MinerPool.find_nonce() raises instead of hanging when a worker dies."""
+    with MinerPool(workers=2) as pool:
+        pool._processes[0].kill()
+        pool._processes[0].join()
+        with pytest.raises(RuntimeError, match="Worker process exited"):
+            pool.find_nonce(STATE, b"", start=2**32, stop=2**33, interval=0.1)
+
+
+def test_miner_pool_full_nonce_space() -> None:
+    """Test MinerPool.find_nonce() accepts the default stop of 2**64."""
+    with MinerPool(workers=1) as pool:
+        assert pool.find_nonce(STATE, b"") == 64
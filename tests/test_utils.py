@@ -1,8 +1,11 @@
 """Test the emu utility functions."""
 
+import sys
 from datetime import datetime
+from hashlib import sha256
 from types import SimpleNamespace
 
+import pytest
 from algokit_utils import Account, TransactionParameters
 from algosdk.atomic_transaction_composer import (
     TransactionWithSigner,
@@ -10,6 +13,7 @@ from algosdk.atomic_transaction_composer import (
 from algosdk.transaction import SuggestedParams
 from algosdk.v2client.algod import AlgodClient
 
+import emu
 import emu.utils as utils
 from emu.models import EmuState
 from smart_contracts.artifacts.emulator.client import ByteReader, EmulatorClient
@@ -88,6 +92,61 @@ def test_find_nonce() -> None:
     assert utils.find_nonce(state, b"") == 64
 
 
+def test_find_nonce_range() -> None:
+    """Test find_nonce() only searches the given range."""
+    state = EmuState(
+        block_height=0,
+        block_hash=b"\x00\x00\x00\x00\x00\x19\xd6h\x9c\x08Z\xe1e\x83\x1e\x93O\xf7c\xaeF\xa2\xa6\xc1r\xb3\xf1\xb6\n\x8c\xe2o",
+        coinbase=b"",
+        prev_retarget_time=datetime(2021, 1, 1),
+        time=datetime(2021, 1, 1),
+        target=b"\x00?\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff",
+    )
+    progress = []
+    assert utils.find_nonce(state, b"", stop=64, on_progress=lambda n, s: progress.append(n)) is None
+    assert progress == [64]
+    assert utils.find_nonce(state, b"", start=60, on_progress=lambda n, s: progress.append(n)) == 64
+    assert progress == [64, 5]
+
+
+def test_scan_nonces_matches_reference() -> None:
+    """Test scan_nonces() agrees with a naive double SHA-256 search."""
+    block_hash = bytes(range(32))
+    coinbase = b"emu"
+    target = utils.pad_target(b"\x0f" + b"\xff" * 30)
+
+    def reference(nonce: int) -> bool:
+        attempt = sha256(sha256(block_hash + utils.itob(nonce) + coinbase).digest()).digest()
+        return utils.btoi(attempt) < utils.btoi(target)
+
+    expected = next(nonce for nonce in range(10_000) if reference(nonce))
+    assert utils.scan_nonces(block_hash, target, coinbase, 0, 10_000) == expected
+
+
+def test_get_kernel(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test get_kernel() falls back to hashlib when Numba is missing."""
+    assert utils.get_kernel("hashlib") is utils.scan_nonces
+    monkeypatch.setitem(sys.modules, "numba", None)
+    monkeypatch.delitem(sys.modules, "emu.jit", raising=False)
+    monkeypatch.delattr(emu, "jit", raising=False)
+    with pytest.warns(RuntimeWarning, match="falling back to the hashlib backend"):
+        assert utils.get_kernel("numba") is utils.scan_nonces
+    with pytest.raises(ValueError, match="Invalid backend"):
+        utils.get_kernel("cuda")
+
+
+def test_pad_target() -> None:
+    """Test pad_target()."""
+    assert utils.pad_target(b"\x3f\xff") == bytes(30) + b"\x3f\xff"
+    assert len(utils.pad_target(b"\x00" + b"\xff" * 31)) == 32
+
+
+def test_hashrate() -> None:
+    """Test hashrate()."""
+    assert utils.hashrate(1000, 2.0) == 500.0
+    assert utils.hashrate(1000, 0.0) == 0.0
+
+
 def test_fetch_state() -> None:
     """Test fetch_state()."""
 
@@ -0,0 +1,50 @@
+"""Test the NumPy nonce search backend."""
+
+from datetime import datetime
+from hashlib import sha256
+
+import pytest
+
+import emu.utils as utils
+from emu.models import EmuState
+
+np = pytest.importorskip("numpy")
+vectorized = pytest.importorskip("emu.vectorized")
+
+BLOCK_HASH = b"\x00\x00\x00\x00\x00\x19\xd6h\x9c\x08Z\xe1e\x83\x1e\x93O\xf7c\xaeF\xa2\xa6\xc1r\xb3\xf1\xb6\n\x8c\xe2o"
+
+
+@pytest.mark.parametrize("coinbase", [b"", b"emu", b"x" * 15, b"x" * 16, b"x" * 24, b"x" * 100])
+def test_sha256d_matches_hashlib(coinbase: bytes) -> None:
+    """Test sha256d() is bit-for-bit identical to hashlib for every message length class."""
+    nonces = np.array([0, 1, 64, 2**32 - 1, 2**32, 2**64 - 1], dtype=np.uint64)
+    digest = vectorized.sha256d(vectorized.message_blocks(BLOCK_HASH, coinbase), nonces)
+    for lane, nonce in enumerate(nonces.tolist()):
+        expected = sha256(sha256(BLOCK_HASH + utils.itob(nonce) + coinbase).digest()).digest()
+        assert b"".join(int(word[lane]).to_bytes(4, "big") for word in digest) == expected
+
+
+def test_below_target() -> None:
+    """Test below_target() compares whole 256-bit values."""
+    target = np.array([0, 0x3FFFFFFF, 5, 0, 0, 0, 0, 0], dtype=np.uint32)
+    digest = [
+        np.array([0, 0, 0, 1], dtype=np.uint32),
+        np.array([0x3FFFFFFF, 0x3FFFFFFF, 0x40000000, 0], dtype=np.uint32),
+        np.array([4, 5, 0, 0], dtype=np.uint32),
+        *(np.zeros(4, dtype=np.uint32) for _ in range(5)),
+    ]
+    assert vectorized.below_target(digest, target).tolist() == [True, False, False, False]
+
+
+def test_find_nonce_numpy() -> None:
+    """Test find_nonce() with the NumPy backend finds the same nonce as hashlib."""
+    state = EmuState(
+        block_height=0,
+        block_hash=BLOCK_HASH,
+        coinbase=b"",
+        prev_retarget_time=datetime(2021, 1, 1),
+        time=datetime(2021, 1, 1),
+        target=b"\x00?\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff",
+    )
+    assert utils.find_nonce(state, b"", backend="numpy") == 64
+    assert utils.find_nonce(state, b"emu", backend="numpy") == utils.find_nonce(state, b"emu")